@@ -0,0 +1,119 @@
+import os
+import shutil
+import time
+import tempfile
+
+
+class SpillQueue(object):
+    ''' LIFO queue of url strings that keeps at most `window` entries in
+    memory. When the window overflows, the oldest half (the entries that
+    would be popped last) is sorted and written to a segment file on disk.
+    When the in-memory window drains, the most recently written segment is
+    read back in one batch. Not thread safe, same as the Frontier. '''
+
+    def __init__(self, spill_dir, window=100_000):
+        assert window >= 2, "Frontier window must hold at least 2 urls"
+        self.window = window
+        self.spill_dir = spill_dir
+        self.in_memory = list()
+        # Only the segment paths and their sizes stay in memory.
+        self.segments = list()
+        self.spilled_count = 0
+        self.segment_id = 0
+
+        # Segments are rebuilt from the save file on every start, so any
+        # left over from a previous run are stale.
+        if os.path.exists(self.spill_dir):
+            shutil.rmtree(self.spill_dir)
+        os.makedirs(self.spill_dir)
+
+    def __len__(self):
+        return len(self.in_memory) + self.spilled_count
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def push(self, url):
+        self.in_memory.append(url)
+        if len(self.in_memory) > self.window:
+            self._spill()
+
+    def pop(self):
+        if not self.in_memory and self.segments:
+            self._refill()
+        # Raises IndexError when empty, like list.pop().
+        return self.in_memory.pop()
+
+    def _spill(self):
+        # Oldest entries sit at the front of the list, so they are the
+        # lowest priority for a LIFO frontier.
+        cut = len(self.in_memory) // 2
+        spilled = sorted(self.in_memory[:cut])
+        del self.in_memory[:cut]
+
+        path = os.path.join(self.spill_dir, f"segment-{self.segment_id}.txt")
+        self.segment_id += 1
+        with open(path, "w", encoding="utf-8") as segment:
+            segment.write("\n".join(spilled))
+            segment.write("\n")
+        self.segments.append((path, len(spilled)))
+        self.spilled_count += len(spilled)
+
+    def _refill(self):
+        # Segments are never larger than half the window, so a refill
+        # always fits in memory.
+        path, count = self.segments.pop()
+        with open(path, "r", encoding="utf-8") as segment:
+            self.in_memory = [line.rstrip("\n") for line in segment if line.strip()]
+        os.remove(path)
+        self.spilled_count -= count
+
+    def close(self):
+        self.in_memory = list()
+        self.segments = list()
+        self.spilled_count = 0
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+
+def benchmark(total=1_000_000, window=10_000):
+    ''' Push then pop `total` urls through a SpillQueue with spilling active
+    and report throughput and peak Python memory. '''
+    import tracemalloc
+
+    spill_dir = tempfile.mkdtemp(prefix="frontier-spill-")
+    queue = SpillQueue(os.path.join(spill_dir, "queue"), window=window)
+    urls = (f"https://www.ics.uci.edu/page/{i}" for i in range(total))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for url in urls:
+        queue.push(url)
+    push_time = time.perf_counter() - start
+    segments = len(queue.segments)
+
+    start = time.perf_counter()
+    popped = 0
+    while queue:
+        queue.pop()
+        popped += 1
+    pop_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    queue.close()
+    shutil.rmtree(spill_dir, ignore_errors=True)
+    assert popped == total, f"Popped {popped} urls, expected {total}"
+
+    print(f"urls: {total}, window: {window}, segments spilled: {segments}")
+    print(f"push: {total / push_time:,.0f} urls/s")
+    print(f"pop:  {total / pop_time:,.0f} urls/s")
+    print(f"peak traced memory: {peak / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--total", type=int, default=1_000_000)
+    parser.add_argument("--window", type=int, default=10_000)
+    args = parser.parse_args()
+    benchmark(args.total, args.window)